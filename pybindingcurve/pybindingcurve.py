@@ -8,6 +8,7 @@ TODO:
 """
 
 
+import warnings
 import numpy as np
 import matplotlib.pyplot as plt
 import lmfit
@@ -31,6 +32,30 @@ pbc_plot_style = {
     "fig_size": (5 * 1.2, 4 * 1.2),
 }
 
+# Simplify dense curve paths when they are built, dropping vertices that
+# would not move the rendered line by more than a pixel
+_CURVE_RC_PARAMS = {"path.simplify": True, "path.simplify_threshold": 1.0}
+
+# Human readable shortcuts for binding systems, keyed with spaces removed
+_SYSTEM_ALIASES = {
+    # 1:1
+    "simple": System_analytical_one_to_one_pl,
+    "1:1": System_analytical_one_to_one_pl,
+    # 1:1 kinetic
+    "simplekinetic": System_kinetic_one_to_one_pl,
+    "1:1kinetic": System_kinetic_one_to_one_pl,
+    # Homodimer formation
+    "homodimer": System_analytical_homodimerformation_pp,
+    "homodimerformation": System_analytical_homodimerformation_pp,
+    # Homodimer formation kinetic - only used for testing purposes
+    "homodimerformationkinetic": System_kinetic_homodimerformation_pp,
+    # Competition
+    "competition": System_analytical_competition_pl,
+    "1:1:1": System_analytical_competition_pl,
+    # Homodimer breaking
+    "homodimerbreaking": System_kinetic_homodimerbreaking_pp,
+}
+
 
 class Readout:
     """
@@ -131,6 +156,8 @@ class _Curve:
     flag denoting that the curve is a traced, real physical solution.
     """
 
+    __slots__ = ("xcoords", "ycoords", "name")
+
     def __init__(self, xcoords: np.array, ycoords: np.array, series_name: str = ""):
         """
         Curve constructor
@@ -167,20 +194,8 @@ class BindingCurve:
         Caan either be a BindingSystem object or a human readable string
         shortcut, such as '1:1' or 'competition', etc.
     """
-    system = None
-    _last_custom_readout = None
-    curves = []
-    fig = None
-    axes = None
-    plot_solution_colours = list("krgbycmrgbycmrgby") + list(
-        np.linspace(0.1, 0.9, num=20)
-    )
-    _min_x_axis = 0.0
-    _max_x_axis = 0.0
-    _min_y_axis = 0.0
-    _max_y_axis = 0.0
-    _num_added_traces = 0
-    _last_known_changing_parameter = "X"
+    # Matplotlib's default colour cycle, reused in order as curves are added
+    _palette = tuple(f"C{i}" for i in range(10))
 
     def query(self, parameters, readout: Readout = None):
         """
@@ -227,14 +242,10 @@ class BindingCurve:
         A list containing the keys of params indicating the name of 
             changing parameters.
         """
-        changing_list = []
-        for p in params.keys():
-            if isinstance(params[p], np.ndarray) or isinstance(params[p], list):
-                changing_list.append(p)
-        if len(changing_list) == 0:
-            return None
-        else:
-            return changing_list
+        changing_list = [
+            k for k, v in params.items() if isinstance(v, (np.ndarray, list))
+        ]
+        return changing_list or None
 
     def __init__(self, binding_system: [str, BindingSystem]):
         """
@@ -253,39 +264,56 @@ class BindingCurve:
             object. Can either be a BindingSystem object or a human readable 
             string shortcut, such as '1:1' or 'competition', etc.
         """
+        self.system = None
+        self._last_custom_readout = None
+        self.curves = []
+        self.fig = None
+        self.axes = None
+        self._min_x_axis = 0.0
+        self._max_x_axis = 0.0
+        self._min_y_axis = 0.0
+        self._max_y_axis = 0.0
+        self._num_added_traces = 0
+        self._last_known_changing_parameter = "X"
+        self._minimizer = None
+        self._minimizer_key = None
+        self.last_error = None
+
         if isinstance(binding_system, str):
-            binding_system = binding_system.lower()
-            # 1:1
-            if binding_system in ["simple", "1:1"]:
-                self.system = System_analytical_one_to_one_pl()
-            # 1:1 kinetic
-            if binding_system in ["simplekinetic", "simple kinetic", "1:1kinetic", "1:1 kinetic"]:
-                self.system = System_kinetic_one_to_one_pl()
-            # Homodimer formation
-            if binding_system in ["homodimerformation", "homodimer formation"]:
-                self.system = System_analytical_homodimerformation_pp()
-            # Homodimer formation kinetic - only used for testing purposes
-            if binding_system in [
-                "homodimerformationkinetic",
-                "homodimer formation kinetic",
-            ]:
-                self.system = System_kinetic_homodimerformation()
-
-            # Competition
-            if binding_system in ["competition", "1:1:1"]:
-                self.system = System_analytical_competition_pl()
-            # Competition
-            if binding_system in ["homodimerbreaking", "homodimer breaking"]:
-                self.system = System_kinetic_homodimerbreaking_pp()
+            system_class = _SYSTEM_ALIASES.get(
+                binding_system.lower().replace(" ", "")
+            )
+            if system_class is None:
+                self._report_error(
+                    "Invalid system specified, try one of: [simple, homodimer, competition, homdimer breaking], or pass a system object"
+                )
+                return None
+            self.system = system_class()
         else:
             if issubclass(binding_system, BindingSystem):
                 self.system = binding_system()
             else:
-                print(
+                self._report_error(
                     "Invalid system specified, try one of: [simple, homodimer, competition, homdimer breaking], or pass a system object"
                 )
                 return None
 
+    def _report_error(self, message: str):
+        """
+        Record an error which prevented an operation from completing
+
+        The message is kept in last_error so that programmatic callers can
+        check it without parsing output, and is also raised as a warning.
+
+        Parameters
+        ----------
+        message : str
+            Description of the error
+        """
+        self.last_error = message
+        # Point the warning at the caller of the public method
+        warnings.warn(message, stacklevel=3)
+
     def _initialize_plot(self):
         """
         Initialise setup to being ready for curve plotting
@@ -299,7 +327,9 @@ class BindingCurve:
             )
             self.axes.grid(True, which="both")
             self.axes.set_ylim(0, 1)
-            plt.tight_layout(rect=(0.05, 0.05, 0.95, 0.92))
+            # Limits are set explicitly in show_plot, so skip rescaling the
+            # view every time a curve or scatter is added
+            self.axes.set_autoscale_on(False)
 
     def add_curve(self, parameters: dict, name: str = None, readout: Readout = None):
         """
@@ -320,15 +350,23 @@ class BindingCurve:
             function.  Predefined standard readouts can be found in the static
             pbc.Readout class.
         """
+        self.last_error = None
         if self.system is None:
-            print("No system defined, could not proceed")
+            self._report_error("No system defined, could not proceed")
             return None
         self._initialize_plot()
         changing_parameters = self._find_changing_parameters(parameters)
-        if not len(changing_parameters) == 1:
-            print("Must have 1 changing parameter, no curves added.")
+        if changing_parameters is None or len(changing_parameters) != 1:
+            self._report_error("Must have 1 changing parameter, no curves added.")
             return
 
+        # Coerce the changing parameter once so the same contiguous array is
+        # shared by the query, the stored curves and the plot
+        changing_parameter = changing_parameters[0]
+        x = np.ascontiguousarray(parameters[changing_parameter], dtype=np.float64)
+        parameters = dict(parameters)
+        parameters[changing_parameter] = x
+
         y_values = self.system.query(parameters)
 
         if readout is not None:
@@ -336,40 +374,37 @@ class BindingCurve:
 
         if y_values.ndim > 1:
             for i in range(y_values.ndim):
-                self.curves.append(
-                    _Curve(parameters[changing_parameters[0]], y_values[i])
-                )
+                self.curves.append(_Curve(x, y_values[i]))
         else:
-            self.curves.append(
-                _Curve(parameters[changing_parameters[0]], y_values))
-        self._last_known_changing_parameter = changing_parameters[0]
-        for curve_it, curve in enumerate(self.curves[self._num_added_traces:]):
-            self._num_added_traces += 1
-            curve_name_with_number = None
-            if name is None:
-                curve_name_with_number = f"Curve {self._num_added_traces}"
-            else:
-                if y_values.ndim == 1:
-                    curve_name_with_number = name
+            self.curves.append(_Curve(x, y_values))
+        self._last_known_changing_parameter = changing_parameter
+        with plt.rc_context(_CURVE_RC_PARAMS):
+            for curve_it, curve in enumerate(self.curves[self._num_added_traces:]):
+                self._num_added_traces += 1
+                curve_name_with_number = None
+                if name is None:
+                    curve_name_with_number = f"Curve {self._num_added_traces}"
                 else:
-                    curve_name_with_number = name + " " + str(curve_it + 1)
-            self.axes.plot(
-                parameters[changing_parameters[0]],
-                curve.ycoords,
-                self.plot_solution_colours[self._num_added_traces] + "-",
-                label=curve_name_with_number,
-                linewidth=2,
-            )
-            self._max_x_axis = np.nanmax(
-                [self._max_x_axis, parameters[changing_parameters[0]][-1]]
-            )
-            self._min_x_axis = np.nanmin(
-                [self._min_x_axis, parameters[changing_parameters[0]][0]]
-            )
-            self._min_y_axis = np.nanmin(
-                [self._min_y_axis, np.nanmin(curve.ycoords)])
-            self._max_y_axis = np.nanmax(
-                [self._max_y_axis, np.nanmax(curve.ycoords)])
+                    if y_values.ndim == 1:
+                        curve_name_with_number = name
+                    else:
+                        curve_name_with_number = name + " " + str(curve_it + 1)
+                self.axes.plot(
+                    x,
+                    curve.ycoords,
+                    "-",
+                    color=self._palette[
+                        (self._num_added_traces - 1) % len(self._palette)
+                    ],
+                    label=curve_name_with_number,
+                    linewidth=2,
+                )
+
+        # Running values are passed first so that NaN extrema are ignored
+        self._min_x_axis = min(self._min_x_axis, float(x[0]))
+        self._max_x_axis = max(self._max_x_axis, float(x[-1]))
+        self._min_y_axis = min(self._min_y_axis, float(np.nanmin(y_values)))
+        self._max_y_axis = max(self._max_y_axis, float(np.nanmax(y_values)))
 
     def add_scatter(self, xcoords, ycoords):
         """
@@ -461,43 +496,28 @@ class BindingCurve:
         if log_y_axis:
             self.axes.set_yscale("log", nonposx="clip")
 
+        axis_label_size = pbc_plot_style["axis_label_size"]
+        axis_label_font = pbc_plot_style["axis_label_font"]
         if xlabel is None:
-            self.axes.set_xlabel(
-                "[" + self._last_known_changing_parameter.upper() + "]",
-                fontsize=pbc_plot_style["axis_label_size"],
-                fontname=pbc_plot_style["axis_label_font"],
-                labelpad=pbc_plot_style["x_axis_labelpad"],
-            )
-        else:
-            self.axes.set_xlabel(
-                xlabel,
-                fontsize=pbc_plot_style["axis_label_size"],
-                fontname=pbc_plot_style["axis_label_font"],
-                labelpad=pbc_plot_style["x_axis_labelpad"],
-            )
+            xlabel = "[" + self._last_known_changing_parameter.upper() + "]"
+        self.axes.set_xlabel(
+            xlabel,
+            fontsize=axis_label_size,
+            fontname=axis_label_font,
+            labelpad=pbc_plot_style["x_axis_labelpad"],
+        )
 
         if ylabel is None:
             if self._last_custom_readout is None:
-                self.axes.set_ylabel(
-                    "[" + self.system.default_readout.upper() + "]",
-                    fontsize=pbc_plot_style["axis_label_size"],
-                    fontname=pbc_plot_style["axis_label_font"],
-                    labelpad=pbc_plot_style["y_axis_labelpad"],
-                )
+                ylabel = "[" + self.system.default_readout.upper() + "]"
             else:
-                self.axes.set_ylabel(
-                    self._last_custom_readout,
-                    fontsize=pbc_plot_style["axis_label_size"],
-                    fontname=pbc_plot_style["axis_label_font"],
-                    labelpad=pbc_plot_style["y_axis_labelpad"],
-                )
-        else:
-            self.axes.set_ylabel(
-                ylabel,
-                fontsize=pbc_plot_style["axis_label_size"],
-                fontname=pbc_plot_style["axis_label_font"],
-                labelpad=pbc_plot_style["y_axis_labelpad"],
-            )
+                ylabel = self._last_custom_readout
+        self.axes.set_ylabel(
+            ylabel,
+            fontsize=axis_label_size,
+            fontname=axis_label_font,
+            labelpad=pbc_plot_style["y_axis_labelpad"],
+        )
 
         self.axes.set_title(
             title,
@@ -509,10 +529,15 @@ class BindingCurve:
         if show_legend:
             self.axes.legend(prop={"size": pbc_plot_style["legend_font_size"]})
 
-        for tick in self.axes.xaxis.get_major_ticks():
-            tick.label.set_fontsize(pbc_plot_style["x_tick_label_font_size"])
-        for tick in self.axes.yaxis.get_major_ticks():
-            tick.label.set_fontsize(pbc_plot_style["y_tick_label_font_size"])
+        self.axes.tick_params(
+            axis="x", labelsize=pbc_plot_style["x_tick_label_font_size"]
+        )
+        self.axes.tick_params(
+            axis="y", labelsize=pbc_plot_style["y_tick_label_font_size"]
+        )
+
+        # Lay out once, now that all labels, ticks and the legend exist
+        self.fig.tight_layout(rect=(0.05, 0.05, 0.95, 0.92))
 
         if png_filename is not None:
             plt.savefig(
@@ -523,6 +548,7 @@ class BindingCurve:
         if svg_filename is not None:
             plt.savefig(svg_filename, metadata={
                         "Title": "pyBindingCurve plot"})
+        self.fig.canvas.draw_idle()
         plt.show()
 
     def fit(
@@ -552,7 +578,10 @@ class BindingCurve:
         xcoords : np.array
             X coordinates of data the system parameters should be fit to
         ycoords : np.array
-            Y coordinates of data the system parameters should be fit to
+            Y coordinates of data the system parameters should be fit to.
+            Replicate measurements may be fit jointly by passing a 2D array
+            of shape (n_series, n_points), each row sharing the system
+            parameters and the changing parameter
         bounds : dict
             Dictionary of tuples, indexed by system parameters denoting the
             lower and upper bounds of a system parameter being fit, optional,
@@ -565,9 +594,12 @@ class BindingCurve:
             then a dictionary containing the accuracy for fitted variables.
         """
         system_parameters_copy = dict(system_parameters)
+        self.last_error = None
         # Check we have parameters to fit, and nothing is missing
         if len(to_fit.keys()) == 0:
-            print("Nothing to fit, insert parameters to fit into to_fit dictionary")
+            self._report_error(
+                "Nothing to fit, insert parameters to fit into to_fit dictionary"
+            )
             return None
         missing = sorted(
             list(
@@ -576,29 +608,48 @@ class BindingCurve:
             )
         )
         if len(missing) > 0:
-            print(
-                "Not all system parameters included in system_parameters or to_fit dictionaries, check all variables for the used equation are included"
+            self._report_error(
+                "Not all system parameters included in system_parameters or to_fit dictionaries, check all variables for the used equation are included. "
+                f"Missing variables are: {missing}"
             )
-            print("Missing variables are: ", missing)
             return None
         # Add parameters for lmfit, accounting for bounds
         if bounds is None:
             bounds = {}
+        param_specs = []
+        for varname, initial_value in to_fit.items():
+            bnd_min, bnd_max = bounds.get(varname, (-np.inf, np.inf))
+            # (name, value, vary, min, max)
+            param_specs.append((varname, initial_value, True, bnd_min, bnd_max))
         params = lmfit.Parameters()
-        for varname in to_fit.keys():
-            bnd_min = -np.inf
-            bnd_max = np.inf
-            if varname in bounds.keys():
-                bnd_min = bounds[varname][0]
-                bnd_max = bounds[varname][1]
-            params.add(
-                varname, value=to_fit[varname], min=bnd_min, max=bnd_max)
-
-        lmmini = lmfit.Minimizer(
-            self._residual, params, fcn_args=(
-                system_parameters_copy, to_fit, ycoords)
+        params.add_many(*param_specs)
+
+        param_names = tuple(to_fit.keys())
+        y_arr = np.ascontiguousarray(ycoords, dtype=np.float64)
+        fcn_args = (system_parameters_copy, param_names, y_arr)
+        # Reuse the Minimizer from the previous fit if it was of the same
+        # variables, such as repeated fits when bootstrapping, updating only
+        # its arguments
+        minimizer_key = (
+            frozenset(param_names), tuple(sorted(system_parameters_copy.keys()))
         )
-        result = lmmini.minimize()
+        if self._minimizer is None or self._minimizer_key != minimizer_key:
+            self._minimizer = lmfit.Minimizer(
+                self._residual, params, fcn_args=fcn_args
+            )
+            self._minimizer_key = minimizer_key
+        else:
+            self._minimizer.userargs = fcn_args
+        lmmini = self._minimizer
+        if hasattr(self.system, "jacobian"):
+            # Analytical derivatives spare lmfit the finite difference evaluations
+            result = lmmini.minimize(
+                params=params, Dfun=self._jacobian, col_deriv=True
+            )
+        else:
+            result = lmmini.minimize(params=params)
+        # Don't keep this fit's data alive through the cached Minimizer
+        lmmini.userargs = ()
 
         for k in system_parameters_copy.keys():
             if isinstance(system_parameters_copy[k], lmfit.parameter.Parameter):
@@ -609,7 +660,9 @@ class BindingCurve:
             dict((p, result.params[p].stderr) for p in result.params),
         )
 
-    def _residual(self, params, system_parameters: dict, to_fit: dict, y: np.array):
+    def _residual(
+        self, params, system_parameters: dict, param_names: tuple, y: np.ndarray
+    ):
         """
         Residual function for fitting parameters.
 
@@ -618,18 +671,68 @@ class BindingCurve:
 
         Parameters
         ----------
-        params : dict
-            A dictionary of the parameters required to be evaluated to a fit model.
+        params : lmfit.Parameters
+            The parameters required to be evaluated to a fit model.
         system_parameters : dict 
             Dictionary containing system parameters, will be used as arguments to the systems equations.
-        to_fit : dict
-            Dictionary containing system parameters to fit.
-        y : np.array
-            A array-like data containing the system parameters should be fit to
+        param_names : tuple
+            Names of the system parameters being fit.
+        y : np.ndarray
+            Contiguous float64 array of the datapoints the system parameters
+            should be fit to, either 1D or 2D with one replicate series per row
+        Returns
+        -------
+            The flattened cost between the experimental datapoints and the values derived from the model.
+        """
+        values = params.valuesdict()
+        for name in param_names:
+            system_parameters[name] = values[name]
+        # The model is evaluated once and broadcast against every series in y
+        return (self.system.query(system_parameters) - y).ravel()
+
+    def _jacobian(
+        self, params, system_parameters: dict, param_names: tuple, y: np.ndarray
+    ):
+        """
+        Jacobian function for fitting parameters.
+
+        Helper function for lm_fit, supplying the analytical derivatives of
+        the residual for systems which provide them.  Where an analytical
+        derivative is not finite, forward differences are used for that
+        parameter instead.
+
+        Parameters
+        ----------
+        params : lmfit.Parameters
+            The parameters required to be evaluated to a fit model.
+        system_parameters : dict 
+            Dictionary containing system parameters, will be used as arguments to the systems equations.
+        param_names : tuple
+            Names of the system parameters being fit.
+        y : np.ndarray
+            Contiguous float64 array of the datapoints the system parameters
+            should be fit to, either 1D or 2D with one replicate series per row
         Returns
         -------
-            The cost between the experimental datapoints and the values derived from the model.
+            Array of shape (n_params, n_residuals) holding the derivatives of
+            the flattened residual.
         """
-        for value in params:
-            system_parameters[value] = float(params[value])
-        return self.system.query(system_parameters) - y
+        values = params.valuesdict()
+        for name in param_names:
+            system_parameters[name] = values[name]
+        jac = self.system.jacobian(system_parameters, param_names)
+        jac = np.array([np.broadcast_to(d, y.shape).ravel() for d in jac])
+        non_finite = np.flatnonzero(~np.isfinite(jac).all(axis=1))
+        if len(non_finite) > 0:
+            residual = (self.system.query(system_parameters) - y).ravel()
+            for row in non_finite:
+                name = param_names[row]
+                step = np.sqrt(np.finfo(np.float64).eps) * max(
+                    abs(values[name]), 1.0
+                )
+                system_parameters[name] = values[name] + step
+                jac[row] = (
+                    (self.system.query(system_parameters) - y).ravel() - residual
+                ) / step
+                system_parameters[name] = values[name]
+        return jac
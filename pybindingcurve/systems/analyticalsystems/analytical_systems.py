@@ -1,4 +1,5 @@
 from mpmath import mpf, sqrt, power, mp, fabs
+import numpy as np
 
 mp.dps = 100
 two_pow_1third = pow(2, 1.0 / 3.0)
@@ -12,6 +13,27 @@ def system01_one_to_one__p_l_kd__pl(p, l, kdpl):
     return ((p + kdpl + l - sqrt(-4 * p * l + power(p + kdpl + l, 2))) / 2.0).real
 
 
+# 1:1 binding, vectorised float64 form for titrations.  Rearranged to avoid
+# the cancellation in s - sqrt(s^2 - 4pl) which mpmath otherwise hides.
+def system01_one_to_one__p_l_kd__pl_vectorised(p, l, kdpl):
+    p = np.asarray(p, dtype=np.float64)
+    l = np.asarray(l, dtype=np.float64)
+    kdpl = np.asarray(kdpl, dtype=np.float64)
+    # Work in place on as few temporaries as possible, this is called for
+    # every residual evaluation when fitting
+    s = p + l + kdpl
+    four_pl = p * l
+    four_pl *= 4
+    # asarray keeps scalar inputs usable as out= targets below
+    result = np.asarray(s * s)
+    result -= four_pl
+    np.sqrt(result, out=result)
+    result += s
+    np.divide(four_pl, result, out=result)
+    result *= 0.5
+    return result
+
+
 # competition
 
 
@@ -764,6 +786,20 @@ def system03_homodimer_formation__p_kdpp__pp(p, kdpp):
     return ((4 * p + kdpp - sqrt(kdpp) * sqrt(8 * p + kdpp)) / 8.0).real
 
 
+# Dimer formation, vectorised float64 form for titrations, rearranged as
+# for 1:1 binding to avoid cancellation
+def system03_homodimer_formation__p_kdpp__pp_vectorised(p, kdpp):
+    p = np.asarray(p, dtype=np.float64)
+    kdpp = np.asarray(kdpp, dtype=np.float64)
+    # Work in place on as few temporaries as possible, as for 1:1 binding
+    result = np.asarray(np.multiply(8 * p + kdpp, kdpp))
+    np.sqrt(result, out=result)
+    result += 4 * p
+    result += kdpp
+    np.divide(2 * p * p, result, out=result)
+    return result
+
+
 # Dimer breaking
 
 
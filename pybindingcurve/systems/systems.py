@@ -27,6 +27,9 @@ class BindingSystem:
     analytical = False
     arguments = []
     default_readout = None
+    # Optional NumPy implementation of the system evaluated over a whole
+    # titration at once, instead of point by point
+    _vectorised_system = None
 
     def _find_changing_parameters(self, params: dict):
         """
@@ -46,14 +49,10 @@ class BindingSystem:
         A list containing the keys of params indicating the name of 
             changing parameters.
         """
-        changing_list = []
-        for p in params.keys():
-            if isinstance(params[p], np.ndarray) or isinstance(params[p], list):
-                changing_list.append(p)
-        if len(changing_list) == 0:
-            return None
-        else:
-            return changing_list
+        changing_list = [
+            k for k, v in params.items() if isinstance(v, (np.ndarray, list))
+        ]
+        return changing_list or None
 
     def __init__(self, bindingsystem: callable, analytical: bool = False):
         """
@@ -132,6 +131,55 @@ class BindingSystem:
             del d["ymax"]
         return d
 
+    def _empty_results(self, changing_values, num_solutions: int):
+        """
+        Allocate the results array for a point by point titration query
+
+        Parameters
+        ----------
+        changing_values : list or array-like
+            Values of the changing parameter.
+        num_solutions : int
+            Number of solutions the system returns per point.
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialised array of shape (n_points,) for single solution
+            systems, or (n_points, num_solutions) otherwise.
+        """
+        if num_solutions == 1:
+            return np.empty(len(changing_values))
+        return np.empty((len(changing_values), num_solutions))
+
+    def _stack_partials(self, partials: dict, wrt: tuple, *arrays):
+        """
+        Assemble a jacobian from per-parameter partial derivatives
+
+        Helper for systems providing a jacobian method, which returns the
+        partial derivatives of the query readout with respect to the
+        parameters named in wrt.
+
+        Parameters
+        ----------
+        partials : dict
+            Partial derivatives of the readout, indexed by parameter name.
+        wrt : tuple
+            Names of the parameters to differentiate with respect to.
+        arrays : np.ndarray
+            System parameter arrays whose broadcast shape gives the number of
+            points.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (len(wrt), n_points), one row per parameter.
+            Derivatives are left non-finite where the analytical form is
+            singular, such as at a KD of zero.
+        """
+        shape = np.broadcast(*arrays).shape
+        return np.array([np.broadcast_to(partials[n], shape) for n in wrt])
+
     def query(self, parameters: dict):
         """
         Query a binding system
@@ -171,14 +219,14 @@ class BindingSystem:
             if len(changing_parameters) == 1:
                 results = None
                 num_solutions = getattr(self, "num_solutions", 1) # Get attribure of num_solutions in BindingSystem class (default = 1)
-                if num_solutions == 1:
-                    results = np.empty(len(parameters[changing_parameters[0]]))
-                else:
-                    results = np.empty(
-                        (len(parameters[changing_parameters[0]]), num_solutions)
-                    )
                 # 1 changing parameter
-                if self.analytical:  # Using an analytical solution
+                if self._vectorised_system is not None and num_solutions == 1:
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        results = self._vectorised_system(**parameters)
+                elif self.analytical:  # Using an analytical solution
+                    results = self._empty_results(
+                        parameters[changing_parameters[0]], num_solutions
+                    )
                     for i in range(results.shape[0]):
                         tmp_params = dict(parameters)
                         tmp_params[changing_parameters[0]] = parameters[
@@ -186,6 +234,9 @@ class BindingSystem:
                         ][i]
                         results[i] = self._system(**tmp_params)
                 else:  # Changing parameter on kinetic solution
+                    results = self._empty_results(
+                        parameters[changing_parameters[0]], num_solutions
+                    )
                     for i in range(results.shape[0]):
                         tmp_params = dict(parameters)
                         tmp_params[changing_parameters[0]] = parameters[
@@ -245,6 +296,9 @@ class System_analytical_one_to_one_pl(BindingSystem):
             analyticalsystems.system01_one_to_one__p_l_kd__pl, analytical=True
         )
         self.default_readout = "pl"
+        self._vectorised_system = (
+            analyticalsystems.system01_one_to_one__p_l_kd__pl_vectorised
+        )
 
     def query(self, parameters: dict):
         if self._are_ymin_ymax_present(parameters):
@@ -261,6 +315,32 @@ class System_analytical_one_to_one_pl(BindingSystem):
         else:
             return super().query(parameters)
 
+    def jacobian(self, parameters: dict, wrt: tuple):
+        """Partial derivatives of the readout, see _stack_partials"""
+        min_max = self._are_ymin_ymax_present(parameters)
+        p = np.asarray(parameters["p"], dtype=np.float64)
+        l = np.asarray(parameters["l"], dtype=np.float64)
+        kdpl = np.asarray(parameters["kdpl"], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = p + l + kdpl
+            d = np.sqrt(s * s - 4 * p * l)
+            pl = (s - d) / 2.0
+            partials = {
+                "p": (1 - (s - 2 * l) / d) / 2.0,
+                "l": (1 - (s - 2 * p) / d) / 2.0,
+                "kdpl": (1 - s / d) / 2.0,
+            }
+            if min_max:
+                yrange = parameters["ymax"] - parameters["ymin"]
+                partials = {
+                    "p": yrange * partials["p"] / l,
+                    "l": yrange * (partials["l"] * l - pl) / (l * l),
+                    "kdpl": yrange * partials["kdpl"] / l,
+                    "ymin": 1 - pl / l,
+                    "ymax": pl / l,
+                }
+            return self._stack_partials(partials, wrt, p, l, kdpl)
+
 
 class System_analytical_competition_pl(BindingSystem):
     def __init__(self):
@@ -291,6 +371,9 @@ class System_analytical_homodimerformation_pp(BindingSystem):
             analyticalsystems.system03_homodimer_formation__p_kdpp__pp, analytical=True
         )
         self.default_readout = "pp"
+        self._vectorised_system = (
+            analyticalsystems.system03_homodimer_formation__p_kdpp__pp_vectorised
+        )
 
     def query(self, parameters: dict):
         if self._are_ymin_ymax_present(parameters):
@@ -307,6 +390,28 @@ class System_analytical_homodimerformation_pp(BindingSystem):
         else:
             return super().query(parameters)
 
+    def jacobian(self, parameters: dict, wrt: tuple):
+        """Partial derivatives of the readout, see _stack_partials"""
+        min_max = self._are_ymin_ymax_present(parameters)
+        p = np.asarray(parameters["p"], dtype=np.float64)
+        kdpp = np.asarray(parameters["kdpp"], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.sqrt(kdpp * kdpp + 8 * p * kdpp)
+            pp = (4 * p + kdpp - r) / 8.0
+            partials = {
+                "p": (1 - kdpp / r) / 2.0,
+                "kdpp": (1 - (kdpp + 4 * p) / r) / 8.0,
+            }
+            if min_max:
+                yrange = parameters["ymax"] - parameters["ymin"]
+                partials = {
+                    "p": 2 * yrange * (partials["p"] * p - pp) / (p * p),
+                    "kdpp": 2 * yrange * partials["kdpp"] / p,
+                    "ymin": 1 - 2 * pp / p,
+                    "ymax": 2 * pp / p,
+                }
+            return self._stack_partials(partials, wrt, p, kdpp)
+
 
 class System_analytical_homodimerbreaking_pp(BindingSystem):
     def __init__(self):